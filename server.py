@@ -6,368 +6,845 @@ Controls PolyNodes application via OSC (Open Sound Control) protocol.
 PolyNodes receives OSC messages on port 4799 (default) at 127.0.0.1.
 """
 
+import asyncio
+import collections
+import functools
 import json
-from typing import Optional
+import os
+import socket
+import struct
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import Annotated, Final, Literal
 from enum import Enum
-from pydantic import BaseModel, Field, ConfigDict, field_validator
+from types import MappingProxyType
+from pydantic import AfterValidator, BaseModel, BeforeValidator, Field, ConfigDict
 from mcp.server.fastmcp import FastMCP
-from pythonosc import udp_client
 
 # ---------------------------------------------------------------------------
 # Server & OSC client setup
 # ---------------------------------------------------------------------------
 
-mcp = FastMCP("polynodes_mcp")
-
 # Default OSC connection settings
 DEFAULT_HOST = "127.0.0.1"
 DEFAULT_PORT = 4799
 
-_osc_client: Optional[udp_client.SimpleUDPClient] = None
+# Send buffer size for the OSC socket; a larger buffer absorbs bursts of
+# parameter changes instead of failing the send when PolyNodes drains slowly.
+SNDBUF_SIZE = int(os.environ.get("POLYNODES_SNDBUF", 1 << 20))
+
+# When > 0, tools only queue their message and a background thread sends
+# whatever was queued within this many milliseconds as OSC bundles.
+# 0 (the default) sends every message immediately.
+COALESCE_MS = float(os.environ.get("POLYNODES_COALESCE_MS", 0))
+
+# When > 0, a tool call that repeats the value last sent to the same address
+# within this many milliseconds is skipped. 0 (the default) sends every call.
+DEDUP_MS = float(os.environ.get("POLYNODES_DEDUP_MS", 0))
+
+# CPU core to pin the coalescing sender thread to (Linux only); unset leaves
+# placement to the scheduler. Pick a core on the NIC's NUMA node.
+SENDER_CPU = os.environ.get("POLYNODES_CPU")
+
+# DSCP "Expedited Forwarding" (46) in the IP TOS byte, marking control traffic low-latency.
+_IPTOS_DSCP_EF = 0xB8
+
+
+def _tune_socket(sock: socket.socket) -> None:
+    """Enlarge the send buffer and mark packets low-latency where supported."""
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SNDBUF_SIZE)
+    if hasattr(socket, "IP_TOS") and sock.family == socket.AF_INET:
+        try:
+            sock.setsockopt(socket.IPPROTO_IP, socket.IP_TOS, _IPTOS_DSCP_EF)
+        except OSError:
+            pass
+
+
+def _open_osc_socket() -> socket.socket:
+    """Create a UDP socket connected to PolyNodes; the address is resolved only here."""
+    family, type_, proto, _, addr = socket.getaddrinfo(DEFAULT_HOST, DEFAULT_PORT, type=socket.SOCK_DGRAM)[0]
+    sock = socket.socket(family, type_, proto)
+    _tune_socket(sock)
+    sock.connect(addr)
+    return sock
+
+
+# One socket for the life of the process, connected once so each message is a
+# plain send() with no per-call address handling. Non-blocking: a full send
+# buffer must never stall the event loop.
+_osc_sock = _open_osc_socket()
+_osc_sock.setblocking(False)
+
+
+# OSC messages that never left the server: the send buffer or coalescing queue
+# was full, or the socket rejected the send. Updated from the event-loop and the
+# coalescing thread, so only through _count_dropped. Reported by polynodes_send_stats.
+_dropped = 0
+_dropped_lock = threading.Lock()
+
+
+def _count_dropped(messages: int) -> None:
+    """Add to the dropped-message count; safe from any thread."""
+    global _dropped
+    with _dropped_lock:
+        _dropped += messages
+
+
+def _send_direct(data: bytes) -> bool:
+    """Write one datagram to the OSC socket; return whether it was handed off."""
+    try:
+        _osc_sock.send(data)
+    except BlockingIOError:
+        return False  # kernel send buffer full: drop rather than block the caller
+    except ConnectionRefusedError:
+        # A connected UDP socket reports an earlier ICMP "port unreachable"
+        # (PolyNodes not running yet) on the next send, which fails instead.
+        return False
+    return True
+
+
+# Datagram writer used by every send, returning whether the datagram was handed
+# off (callers count what was dropped); swapped for the asyncio transport while
+# the MCP server is running (see _osc_transport).
+_send_dgram = _send_direct
+
+_FLOAT = struct.Struct(">f")
+
+def _osc_prefix(address: str) -> bytes:
+    """Encode everything of a one-float OSC message except the float itself."""
+    addr = address.encode("utf-8") + b"\0"
+    return addr + b"\0" * (-len(addr) % 4) + b",f\0\0"
+
+
+_SEND_STATUS = "queued" if COALESCE_MS > 0 else "sent"
+
+# Same text json.dumps() produces for {"status": ..., "address": ..., "value": ...},
+# filled with the value's repr().
+_REPLY_TEMPLATE = '{"status": "%s", "address": %s, "value": %s}'
+
+# json.dumps() spells the non-finite floats differently from repr().
+_NON_FINITE_JSON: Final = {"nan": "NaN", "inf": "Infinity", "-inf": "-Infinity"}
+
+
+@functools.lru_cache(maxsize=256)
+def _json_address(address: str) -> str:
+    """JSON-encode an OSC address once; tools only ever send a few dozen distinct ones."""
+    return json.dumps(address)
+
+
+def _send_osc_raw(address: str, value: float) -> bool:
+    """Send (or queue, when coalescing) a single OSC message; False if it was dropped."""
+    if COALESCE_MS > 0:
+        # Fail here, like the direct path does, rather than in the worker's encode.
+        _FLOAT.pack(value)
+        if len(_osc_queue) == _osc_queue.maxlen:
+            _count_dropped(1)  # the append below evicts the oldest queued message
+        _osc_queue.append((address, value))
+        _osc_queue_ready.set()
+        return True
+    frame = _FRAME_CACHE.get(address)
+    if frame is None:
+        # Only raw OSC reaches here; it is encoded without growing the cache.
+        sent = _send_dgram(_osc_prefix(address) + _FLOAT.pack(value))
+    else:
+        _FLOAT.pack_into(frame, -4, value)
+        sent = _send_dgram(frame)
+    if not sent:
+        _count_dropped(1)
+    return sent
+
+
+def _format_reply(status: str, address: str, value_repr: str) -> str:
+    """Build the JSON confirmation for one message from repr(value)."""
+    return _REPLY_TEMPLATE % (status, _json_address(address), _NON_FINITE_JSON.get(value_repr, value_repr))
+
+
+# Switches, triggers and preset slots repeat the same (address, value) pairs, so their
+# confirmation text is reused. Keyed on repr(value): 1 and 1.0, or 0.0 and -0.0,
+# compare and hash equal but must not share a reply.
+@functools.lru_cache(maxsize=1024)
+def _confirm(status: str, address: str, value_repr: str) -> str:
+    return _format_reply(status, address, value_repr)
 
 
-def _get_client(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> udp_client.SimpleUDPClient:
-    """Get or create an OSC UDP client."""
-    global _osc_client
-    if _osc_client is None:
-        _osc_client = udp_client.SimpleUDPClient(host, port)
-    return _osc_client
+# Addresses whose every message is an action (fire a trigger, reload a preset),
+# so a repeated value is never redundant.
+_NO_DEDUP: Final = frozenset({
+    "/polynodes/navigrndtrig",
+    "/polynodes/rearrtrig",
+    "/polynodes/presetslot",
+})
+
+# Last (repr(value), monotonic time) handed off per address by _send_osc, for
+# POLYNODES_DEDUP_MS. Raw and batched sends bypass it and invalidate their addresses.
+_last_sent: dict[str, tuple[str, float]] = {}
+
+
+def _forget_sent(addresses) -> None:
+    """Drop the dedup record of addresses just sent outside _send_osc."""
+    if _last_sent:
+        for address in addresses:
+            _last_sent.pop(address, None)
 
 
 def _send_osc(address: str, value: float) -> str:
-    """Send a single OSC message and return confirmation."""
-    client = _get_client()
-    client.send_message(address, value)
-    return json.dumps({"status": "sent", "address": address, "value": value})
+    """Send a message to a known PolyNodes address and return confirmation."""
+    value_repr = repr(value)
+    dedup = DEDUP_MS > 0 and address not in _NO_DEDUP
+    if dedup:
+        now = time.monotonic()
+        last = _last_sent.get(address)
+        # The window counts from the last real send, so a steady stream of one
+        # value is still re-sent once per window and PolyNodes stays in sync.
+        if last is not None and last[0] == value_repr and now - last[1] < DEDUP_MS / 1000:
+            return _confirm("unchanged", address, value_repr)
+    if not _send_osc_raw(address, value):
+        return _confirm("dropped", address, value_repr)
+    if dedup:
+        _last_sent[address] = (value_repr, now)  # only once it actually went out
+    return _confirm(_SEND_STATUS, address, value_repr)
+
+
+# "#bundle" tag plus the NTP time tag 1, which OSC reserves for "immediately".
+_BUNDLE_HEADER = b"#bundle\0" + struct.pack(">Q", 1)
+_ELEMENT_SIZE = struct.Struct(">i")
+
+
+def _encode_bundle(pairs: list[tuple[str, float]]) -> bytes:
+    """Encode address/value pairs as one OSC bundle to be executed immediately."""
+    parts = [_BUNDLE_HEADER]
+    for address, value in pairs:
+        frame = _FRAME_CACHE.get(address)
+        # The frame's prefix bytes are never rewritten, only its trailing float slot.
+        prefix = _osc_prefix(address) if frame is None else frame[:-4]
+        parts.append(_ELEMENT_SIZE.pack(len(prefix) + 4))
+        parts.append(prefix)
+        parts.append(_FLOAT.pack(value))
+    return b"".join(parts)
+
+
+def _send_osc_bundle(pairs: list[tuple[str, float]]) -> str:
+    """Send several OSC messages as bundles of up to _COALESCE_MAX_MESSAGES each."""
+    # Encode every bundle before sending anything, so a value that cannot be
+    # encoded fails the whole batch instead of leaving it partly applied.
+    chunks = [pairs[i:i + _COALESCE_MAX_MESSAGES] for i in range(0, len(pairs), _COALESCE_MAX_MESSAGES)]
+    bundles = [_encode_bundle(chunk) for chunk in chunks]
+    if COALESCE_MS > 0:
+        _flush_osc_queue(_send_dgram)  # keep earlier single messages ahead of the batch
+    _forget_sent(address for address, _ in pairs)
+    dropped = 0
+    for chunk, bundle in zip(chunks, bundles):
+        if not _send_dgram(bundle):
+            dropped += len(chunk)
+    if dropped:
+        _count_dropped(dropped)
+    reply = {
+        "status": "sent" if not dropped else "dropped" if dropped == len(pairs) else "partial",
+        "messages": [{"address": address, "value": value} for address, value in pairs],
+    }
+    if dropped:
+        reply["dropped"] = dropped
+    return json.dumps(reply)
+
+
+# ---------------------------------------------------------------------------
+# Message coalescing (POLYNODES_COALESCE_MS)
+# ---------------------------------------------------------------------------
+
+# Messages per bundle (coalesced or batched), so a long burst never exceeds one datagram.
+_COALESCE_MAX_MESSAGES = 64
+
+# Filled by _send_osc on the event-loop thread, drained by the worker thread;
+# deque append/popleft are thread-safe. When full, the oldest entries go first.
+_osc_queue: collections.deque[tuple[str, float]] = collections.deque(maxlen=4096)
+_osc_queue_ready = threading.Event()
+
+
+# Held from popping a chunk until it is sent, so a flush on the event-loop thread
+# and one on the worker never interleave and messages leave in queue order.
+_flush_lock = threading.Lock()
+
+
+def _flush_osc_queue(send) -> int:
+    """Send everything queued so far as bundles through `send`; return how many went out.
+
+    The event-loop thread passes _send_dgram, the worker its own blocking socket,
+    so the loop never blocks in a send itself; the lock is taken per chunk, so at
+    most it waits while the worker finishes the chunk it has in flight. A chunk
+    that cannot be encoded or sent is counted as dropped and the flush goes on.
+    """
+    sent = 0
+    while True:
+        with _flush_lock:
+            pairs = []
+            try:
+                while len(pairs) < _COALESCE_MAX_MESSAGES:
+                    pairs.append(_osc_queue.popleft())
+            except IndexError:
+                pass
+            if not pairs:
+                return sent
+            try:
+                ok = send(_encode_bundle(pairs))
+            except (OSError, OverflowError, struct.error):
+                ok = False  # e.g. EMSGSIZE from very long raw addresses
+        if ok:
+            sent += len(pairs)
+        else:
+            _count_dropped(len(pairs))
+
+
+def _send_coalesced(data: bytes) -> bool:
+    """Write one bundle to the worker's blocking socket; return whether it was handed off."""
+    try:
+        _coalesce_sock.send(data)
+    except ConnectionRefusedError:  # see _send_direct
+        return False
+    return True
+
+
+def _coalesce_worker() -> None:
+    """Wait for the first queued message, let the window fill, then flush."""
+    window = COALESCE_MS / 1000
+    while True:
+        _osc_queue_ready.wait()
+        time.sleep(window)
+        _osc_queue_ready.clear()
+        _flush_osc_queue(_send_coalesced)
+
+
+if COALESCE_MS > 0:
+    # A separate blocking socket: the worker may wait on a full send buffer
+    # without touching the event loop's non-blocking socket or transport.
+    _coalesce_sock = _open_osc_socket()
+    _coalesce_thread = threading.Thread(target=_coalesce_worker, name="osc-coalesce", daemon=True)
+    _coalesce_thread.start()
+    if SENDER_CPU is not None and hasattr(os, "sched_setaffinity"):
+        # Pins only this thread (a Linux thread id is a valid pid here); an
+        # unavailable core raises now rather than killing the worker later.
+        os.sched_setaffinity(_coalesce_thread.native_id, {int(SENDER_CPU)})
+
+
+class _OscProtocol(asyncio.DatagramProtocol):
+    """Track the datagrams the transport reports as failed instead of ignoring them."""
+
+    def __init__(self) -> None:
+        self.sending = False  # inside transport.sendto() (see _osc_transport)
+        self.send_failed = False
+
+    def error_received(self, exc: Exception) -> None:
+        if self.sending:
+            self.send_failed = True  # the caller counts the datagram's messages
+        else:
+            # A backlogged datagram failed later; its message count is unknown.
+            _count_dropped(1)
+
+
+@asynccontextmanager
+async def _osc_transport(server: FastMCP):
+    """Send through a non-blocking asyncio datagram transport while the server runs.
+
+    The socket is non-blocking, so a plain sendto() on the event-loop thread
+    fails with BlockingIOError once the kernel send buffer is full. The
+    transport instead queues the datagram and flushes it when the socket
+    becomes writable again; a backlog beyond SNDBUF_SIZE is dropped and counted.
+    """
+    global _send_dgram
+    loop = asyncio.get_running_loop()
+    transport, protocol = await loop.create_datagram_endpoint(_OscProtocol, sock=_osc_sock.dup())
+    get_backlog, sendto = transport.get_write_buffer_size, transport.sendto
+
+    def send(data: bytes) -> bool:
+        # Past a second send buffer's worth of backlog PolyNodes is not keeping
+        # up; drop instead of letting the transport queue grow without bound.
+        if get_backlog() > SNDBUF_SIZE:
+            return False
+        # A send the socket rejects (oversized, refused) reaches error_received
+        # from inside sendto(), which flags it on the protocol.
+        protocol.sending, protocol.send_failed = True, False
+        try:
+            sendto(data)
+        finally:
+            protocol.sending = False
+        return not protocol.send_failed
+
+    _send_dgram = send
+    try:
+        yield
+    finally:
+        _send_dgram = _send_direct
+        transport.close()
+
+
+mcp = FastMCP("polynodes_mcp", lifespan=_osc_transport)
+
+# Tool hints shared by every tool that sends a parameter value to PolyNodes.
+_SETTER_HINTS: Final = MappingProxyType({
+    "readOnlyHint": False,
+    "destructiveHint": False,
+    "idempotentHint": True,
+    "openWorldHint": True,
+})
+
+
+def _setter_tool(name: str, title: str):
+    """Register an OSC-sending tool under `name` with the shared setter hints."""
+    return mcp.tool(name=name, annotations={"title": title, **_SETTER_HINTS})
+
+
+# ---------------------------------------------------------------------------
+# OSC address tables (per layer / cuboid / IsoMorph target)
+# ---------------------------------------------------------------------------
+
+_GAIN_ADDRS: Final = {
+    "macro": "/polynodes/MacroGain",
+    "meso": "/polynodes/MesoGain",
+    "micro": "/polynodes/MicroGain",
+}
+
+_GAIN_SOLO_ADDRS: Final = {
+    "macro": "/polynodes/MacroGainsolo",
+    "meso": "/polynodes/MesoGainsolo",
+    "micro": "/polynodes/MicroGainsolo",
+}
+
+_ENVTIME_ADDRS: Final = {
+    "macro": "/polynodes/MacroEnvtime",
+    "meso": "/polynodes/MesoEnvtime",
+    "micro": "/polynodes/MicroEnvtime",
+}
+
+_PBR_ADDRS: Final = {
+    "macro": "/polynodes/pbrmacro",
+    "meso": "/polynodes/pbrmeso",
+    "micro": "/polynodes/pbrmicro",
+}
+
+_PBR_MR_ADDRS: Final = {
+    "macro": "/polynodes/pbrmacroMR",
+    "meso": "/polynodes/pbrmesoMR",
+    "micro": "/polynodes/pbrmicroMR",
+}
+
+_FILTER_SW_ADDRS: Final = {
+    "macro": "/polynodes/filtmacrosw",
+    "meso": "/polynodes/filtmesosw",
+    "micro": "/polynodes/filtmicrosw",
+}
+
+_FILTER_ADDRS: Final = {
+    "macro": "/polynodes/filtmacro",
+    "meso": "/polynodes/filtmeso",
+    "micro": "/polynodes/filtmicro",
+}
+
+_FILTER_MR_ADDRS: Final = {
+    "macro": "/polynodes/filtmacroMR",
+    "meso": "/polynodes/filtmesoMR",
+    "micro": "/polynodes/filtmicroMR",
+}
+
+_COMB_SW_ADDRS: Final = {
+    "macro": "/polynodes/combmacrosw",
+    "meso": "/polynodes/combmesosw",
+    "micro": "/polynodes/combmicrosw",
+}
+
+_COMB_ADDRS: Final = {
+    "macro": "/polynodes/combmacro",
+    "meso": "/polynodes/combmeso",
+    "micro": "/polynodes/combmicro",
+}
+
+_COMB_MR_ADDRS: Final = {
+    "macro": "/polynodes/combmacroMR",
+    "meso": "/polynodes/combmesoMR",
+    "micro": "/polynodes/combmicroMR",
+}
+
+_BH_FORCE_ADDRS: Final = {
+    "macro": "/polynodes/BHmacroforce",
+    "meso": "/polynodes/BHmesoforce",
+    "micro": "/polynodes/BHmicroforce",
+}
+
+_WH_FORCE_ADDRS: Final = {
+    "macro": "/polynodes/WHmacroforce",
+    "meso": "/polynodes/WHmesoforce",
+    "micro": "/polynodes/WHmicroforce",
+}
+
+_RM_ADDRS: Final = {
+    "macro": "/polynodes/RMmacro",
+    "meso": "/polynodes/RMmeso",
+    "micro": "/polynodes/RMmicro",
+}
+
+_CUBE_RETURN_ADDRS: Final = {
+    "macro": "/polynodes/MacroreturnLvl",
+    "meso": "/polynodes/MesoreturnLvl",
+    "micro": "/polynodes/MicroreturnLvl",
+}
+
+# Per cuboid, indexed by cube number - 1
+_CUBOID_SW_ADDRS: Final[tuple[str, str, str]] = (
+    "/polynodes/C1sw",
+    "/polynodes/C2sw",
+    "/polynodes/C3sw",
+)
+
+# Per IsoMorph modulation target (freq/amp/res)
+_ISOMORPH_SW_ADDRS: Final = {
+    "freq": "/polynodes/isomfreqsw",
+    "amp": "/polynodes/isomampsw",
+    "res": "/polynodes/isomressw",
+}
+
+_ERR_ISOMORPH_PARAM_JSON: Final[str] = json.dumps({"error": "param must be 'freq', 'amp', or 'res'"})
+
+_ISOMORPH_DEPTH_ADDRS: Final = {
+    "freq": "/polynodes/isomfreqmodr",
+    "amp": "/polynodes/isomampmodr",
+    "res": "/polynodes/isomresmodr",
+}
+
+
+# ---------------------------------------------------------------------------
+# OSC address catalogue (served by polynodes_list_osc_addresses)
+# ---------------------------------------------------------------------------
+
+_ADDRESSES = {
+    "transport": {
+        "/polynodes/playstartstop": "Play/Stop (0.0 or 1.0)",
+        "/polynodes/presetslot": "Preset Slot (1-10)",
+        "/polynodes/seqbpm": "BPM (10-300)",
+    },
+    "gain": {
+        "/polynodes/MacroGain": "Macro Gain dB (-80 to 20)",
+        "/polynodes/MesoGain": "Meso Gain dB (-80 to 20)",
+        "/polynodes/MicroGain": "Micro Gain dB (-80 to 20)",
+        "/polynodes/DryWet": "Dry/Wet (0.0-1.0)",
+        "/polynodes/MacroGainsolo": "Macro Solo (0/1)",
+        "/polynodes/MesoGainsolo": "Meso Solo (0/1)",
+        "/polynodes/MicroGainsolo": "Micro Solo (0/1)",
+    },
+    "envelope": {
+        "/polynodes/MacroEnvtime": "Macro Env Time (0.01-0.5)",
+        "/polynodes/MesoEnvtime": "Meso Env Time (0.01-0.5)",
+        "/polynodes/MicroEnvtime": "Micro Env Time (0.01-0.5)",
+    },
+    "playback_rate": {
+        "/polynodes/pbrmacro": "Macro PBR (0.3-10)",
+        "/polynodes/pbrmeso": "Meso PBR (0.3-20)",
+        "/polynodes/pbrmicro": "Micro PBR (0.3-30)",
+        "/polynodes/pbrmacroMR": "Macro PBR ModRange (0-0.75)",
+        "/polynodes/pbrmesoMR": "Meso PBR ModRange (0-0.75)",
+        "/polynodes/pbrmicroMR": "Micro PBR ModRange (0-0.75)",
+    },
+    "granulator": {
+        "/polynodes/granusw": "Granulator Switch (0/1)",
+        "/polynodes/granuDur": "Duration (10-1000)",
+        "/polynodes/granuDurMR": "Duration ModRange (0-0.75)",
+    },
+    "bandpass_filter": {
+        "/polynodes/filtmacrosw": "Macro Filter Switch (0/1)",
+        "/polynodes/filtmesosw": "Meso Filter Switch (0/1)",
+        "/polynodes/filtmicrosw": "Micro Filter Switch (0/1)",
+        "/polynodes/filtmacro": "Macro Freq (80-8000)",
+        "/polynodes/filtmeso": "Meso Freq (80-8000)",
+        "/polynodes/filtmicro": "Micro Freq (80-8000)",
+        "/polynodes/filtmacroMR": "Macro Filter ModRange (0-0.75)",
+        "/polynodes/filtmesoMR": "Meso Filter ModRange (0-0.75)",
+        "/polynodes/filtmicroMR": "Micro Filter ModRange (0-0.75)",
+    },
+    "comb_filter": {
+        "/polynodes/combmacrosw": "Macro Comb Switch (0/1)",
+        "/polynodes/combmesosw": "Meso Comb Switch (0/1)",
+        "/polynodes/combmicrosw": "Micro Comb Switch (0/1)",
+        "/polynodes/combmacro": "Macro Comb (10-3000)",
+        "/polynodes/combmeso": "Meso Comb (10-1000)",
+        "/polynodes/combmicro": "Micro Comb (10-300)",
+        "/polynodes/combmacroMR": "Macro Comb ModRange (0-0.75)",
+        "/polynodes/combmesoMR": "Meso Comb ModRange (0-0.75)",
+        "/polynodes/combmicroMR": "Micro Comb ModRange (0-0.75)",
+    },
+    "blackhole": {
+        "/polynodes/BHsw": "BH Switch (0/1)",
+        "/polynodes/BHmacroforce": "BH Macro Force (0-1)",
+        "/polynodes/BHmesoforce": "BH Meso Force (0-1)",
+        "/polynodes/BHmicroforce": "BH Micro Force (0-1)",
+    },
+    "whitehole": {
+        "/polynodes/WHsw": "WH Switch (0/1)",
+        "/polynodes/WHmacroforce": "WH Macro Force (0-1)",
+        "/polynodes/WHmesoforce": "WH Meso Force (0-1)",
+        "/polynodes/WHmicroforce": "WH Micro Force (0-1)",
+    },
+    "ring_modulator": {
+        "/polynodes/RMsw": "RM Switch (0/1)",
+        "/polynodes/RMmacro": "RM Macro (1-3)",
+        "/polynodes/RMmeso": "RM Meso (1-3)",
+        "/polynodes/RMmicro": "RM Micro (1-3)",
+    },
+    "bitcrusher": {
+        "/polynodes/CRSsw": "Crush Switch (0/1)",
+        "/polynodes/CRSbitLvl": "Bit Level (0-1)",
+        "/polynodes/CRSrange": "Range (0-5)",
+    },
+    "resonator": {
+        "/polynodes/ResoSw": "Resonator Switch (0/1)",
+        "/polynodes/ResoFreqdist": "Freq Distribution (1-3)",
+        "/polynodes/ResoBalance": "Balance (0-0.5)",
+    },
+    "cuboid_fx": {
+        "/polynodes/C1sw": "Cuboid 1 Switch (0/1)",
+        "/polynodes/C2sw": "Cuboid 2 Switch (0/1)",
+        "/polynodes/C3sw": "Cuboid 3 Switch (0/1)",
+        "/polynodes/MacroreturnLvl": "Macro Return (1-80)",
+        "/polynodes/MesoreturnLvl": "Meso Return (1-80)",
+        "/polynodes/MicroreturnLvl": "Micro Return (1-80)",
+    },
+    "isomorph": {
+        "/polynodes/isomorphsw": "IsoMorph Switch (0/1)",
+        "/polynodes/isomfreqsw": "Freq Mod Switch (0/1)",
+        "/polynodes/isomfreqmodr": "Freq Mod Depth (0-2)",
+        "/polynodes/isomampsw": "Amp Mod Switch (0/1)",
+        "/polynodes/isomampmodr": "Amp Mod Depth (0-2)",
+        "/polynodes/isomressw": "Res Mod Switch (0/1)",
+        "/polynodes/isomresmodr": "Res Mod Depth (0-2)",
+        "/polynodes/isombpcent": "BP Center (0-5000)",
+    },
+    "navigation": {
+        "/polynodes/navigrndtrig": "Nav Random Trigger (0/1)",
+        "/polynodes/rearrtrig": "Rearrange Trigger (0/1)",
+        "/polynodes/polygatessw": "Poly Gates Switch (0/1)",
+    },
+    "tuning": {
+        "/polynodes/tuningpbsw": "Tuning PB Switch (0/1)",
+        "/polynodes/tuningressw": "Tuning Res Switch (0/1)",
+    },
+    "camera": {
+        "/polynodes/camzoom": "Camera Zoom (+/- float)",
+        "/polynodes/camrotate": "Camera Rotate (radians)",
+    },
+}
+
+# The catalogue never changes, so polynodes_list_osc_addresses returns this string as is.
+_ADDRESSES_JSON: Final[str] = json.dumps(_ADDRESSES, indent=2)
+
+# Ready-to-send datagram for every known address: the encoded address and ",f"
+# type tag followed by a 4-byte float slot that is overwritten in place on each
+# send. FastMCP runs the (synchronous) tools on its event-loop thread, so a
+# frame is never written by two threads at once.
+_FRAME_CACHE: dict[str, bytearray] = {
+    address: bytearray(_osc_prefix(address) + bytes(4))
+    for group in _ADDRESSES.values()
+    for address in group
+}
 
 
 # ---------------------------------------------------------------------------
 # Input Models
 # ---------------------------------------------------------------------------
 
+def _aliases(*names: str) -> dict[str, str]:
+    """Map the common spellings of each name (lower, Title, UPPER) to the name itself."""
+    return {variant: name for name in names for variant in (name, name.capitalize(), name.upper())}
+
+
+_LEVEL_ALIASES = _aliases("macro", "meso", "micro")
+_ISOMORPH_PARAM_ALIASES = _aliases("freq", "amp", "res")
+
+
+def _fold_level(v: object) -> object:
+    """Map case/whitespace variants onto the canonical layer name; the Literal rejects the rest."""
+    if isinstance(v, str):
+        return _LEVEL_ALIASES.get(v) or _LEVEL_ALIASES.get(v.strip().lower(), v)
+    return v
+
+
+def _fold_isomorph_param(v: object) -> object:
+    """Map case/whitespace variants onto the canonical IsoMorph target; the Literal rejects the rest."""
+    if isinstance(v, str):
+        return _ISOMORPH_PARAM_ALIASES.get(v) or _ISOMORPH_PARAM_ALIASES.get(v.strip().lower(), v)
+    return v
+
+
+# Membership is checked by pydantic-core's literal matcher and published as an
+# enum in the tool schema; only the case folding runs in Python.
+Level = Annotated[Literal["macro", "meso", "micro"], BeforeValidator(_fold_level)]
+IsomorphParam = Annotated[Literal["freq", "amp", "res"], BeforeValidator(_fold_isomorph_param)]
+
+
+def _check_osc_float(v: float) -> float:
+    """Reject finite values that overflow the 32-bit float an OSC message carries."""
+    try:
+        _FLOAT.pack(v)
+    except OverflowError:
+        raise ValueError("value does not fit a 32-bit OSC float") from None
+    return v
+
+
+OscFloat = Annotated[float, AfterValidator(_check_osc_float)]
+
+
+class _LeveledInput(BaseModel):
+    """Base for inputs addressed to one of the macro/meso/micro layers."""
+    level: Level = Field(..., description="'macro', 'meso', or 'micro'")
+
+
 class PlayStopInput(BaseModel):
     """Input for play/stop control."""
-    model_config = ConfigDict(str_strip_whitespace=True)
     state: float = Field(..., description="1.0 to play, 0.0 to stop", ge=0.0, le=1.0)
 
 
 class PresetSlotInput(BaseModel):
     """Input for preset selection."""
-    model_config = ConfigDict(str_strip_whitespace=True)
     slot: float = Field(..., description="Preset slot number (1 to 10)", ge=1.0, le=10.0)
 
 
-class GainInput(BaseModel):
+class GainInput(_LeveledInput):
     """Input for gain/volume controls."""
-    model_config = ConfigDict(str_strip_whitespace=True)
-    level: str = Field(..., description="Which level: 'macro', 'meso', or 'micro'")
+    level: Level = Field(..., description="Which level: 'macro', 'meso', or 'micro'")
     value: float = Field(..., description="Gain value in dB (-80.0 to 20.0)", ge=-80.0, le=20.0)
 
-    @field_validator("level")
-    @classmethod
-    def validate_level(cls, v: str) -> str:
-        v = v.lower().strip()
-        if v not in ("macro", "meso", "micro"):
-            raise ValueError("level must be 'macro', 'meso', or 'micro'")
-        return v
-
 
 class DryWetInput(BaseModel):
     """Input for dry/wet balance."""
-    model_config = ConfigDict(str_strip_whitespace=True)
     value: float = Field(..., description="Dry/Wet balance (0.0 = dry, 1.0 = wet)", ge=0.0, le=1.0)
 
 
-class EnvelopeTimeInput(BaseModel):
+class EnvelopeTimeInput(_LeveledInput):
     """Input for envelope time."""
-    model_config = ConfigDict(str_strip_whitespace=True)
-    level: str = Field(..., description="'macro', 'meso', or 'micro'")
     value: float = Field(..., description="Envelope time (0.01 to 0.5)", ge=0.01, le=0.5)
 
-    @field_validator("level")
-    @classmethod
-    def validate_level(cls, v: str) -> str:
-        v = v.lower().strip()
-        if v not in ("macro", "meso", "micro"):
-            raise ValueError("level must be 'macro', 'meso', or 'micro'")
-        return v
-
 
-class PlaybackRateInput(BaseModel):
+class PlaybackRateInput(_LeveledInput):
     """Input for playback rate."""
-    model_config = ConfigDict(str_strip_whitespace=True)
-    level: str = Field(..., description="'macro' (0.3-10), 'meso' (0.3-20), or 'micro' (0.3-30)")
+    level: Level = Field(..., description="'macro' (0.3-10), 'meso' (0.3-20), or 'micro' (0.3-30)")
     value: float = Field(..., description="Playback rate value")
 
-    @field_validator("level")
-    @classmethod
-    def validate_level(cls, v: str) -> str:
-        v = v.lower().strip()
-        if v not in ("macro", "meso", "micro"):
-            raise ValueError("level must be 'macro', 'meso', or 'micro'")
-        return v
 
-
-class PlaybackRateMRInput(BaseModel):
-    """Input for playback rate modulation range."""
-    model_config = ConfigDict(str_strip_whitespace=True)
-    level: str = Field(..., description="'macro', 'meso', or 'micro'")
+class LeveledModRangeInput(_LeveledInput):
+    """Input for a per-layer stochastic modulation range (playback rate, filter, comb)."""
     value: float = Field(..., description="Modulation range (0.0 to 0.75)", ge=0.0, le=0.75)
 
-    @field_validator("level")
-    @classmethod
-    def validate_level(cls, v: str) -> str:
-        v = v.lower().strip()
-        if v not in ("macro", "meso", "micro"):
-            raise ValueError("level must be 'macro', 'meso', or 'micro'")
-        return v
-
 
 class SwitchInput(BaseModel):
     """Generic on/off switch input."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    state: float = Field(..., description="0.0 = off, 1.0 = on", ge=0.0, le=1.0)
+
+
+class LeveledSwitchInput(_LeveledInput):
+    """Input for a per-layer on/off switch (filter, comb)."""
     state: float = Field(..., description="0.0 = off, 1.0 = on", ge=0.0, le=1.0)
 
 
 class GranularDurationInput(BaseModel):
     """Input for granular duration."""
-    model_config = ConfigDict(str_strip_whitespace=True)
     value: float = Field(..., description="Duration (10.0 to 1000.0)", ge=10.0, le=1000.0)
 
 
 class GranularDurationMRInput(BaseModel):
     """Input for granular duration modulation range."""
-    model_config = ConfigDict(str_strip_whitespace=True)
     value: float = Field(..., description="Modulation range (0.0 to 0.75)", ge=0.0, le=0.75)
 
 
-class FilterInput(BaseModel):
+class FilterInput(_LeveledInput):
     """Input for bandpass filter frequency."""
-    model_config = ConfigDict(str_strip_whitespace=True)
-    level: str = Field(..., description="'macro', 'meso', or 'micro'")
     value: float = Field(..., description="Center frequency (80.0 to 8000.0 Hz)", ge=80.0, le=8000.0)
 
-    @field_validator("level")
-    @classmethod
-    def validate_level(cls, v: str) -> str:
-        v = v.lower().strip()
-        if v not in ("macro", "meso", "micro"):
-            raise ValueError("level must be 'macro', 'meso', or 'micro'")
-        return v
-
-
-class FilterMRInput(BaseModel):
-    """Input for bandpass filter modulation range."""
-    model_config = ConfigDict(str_strip_whitespace=True)
-    level: str = Field(..., description="'macro', 'meso', or 'micro'")
-    value: float = Field(..., description="Modulation range (0.0 to 0.75)", ge=0.0, le=0.75)
 
-    @field_validator("level")
-    @classmethod
-    def validate_level(cls, v: str) -> str:
-        v = v.lower().strip()
-        if v not in ("macro", "meso", "micro"):
-            raise ValueError("level must be 'macro', 'meso', or 'micro'")
-        return v
-
-
-class FilterSwitchInput(BaseModel):
-    """Input for filter on/off per level."""
-    model_config = ConfigDict(str_strip_whitespace=True)
-    level: str = Field(..., description="'macro', 'meso', or 'micro'")
-    state: float = Field(..., description="0.0 = off, 1.0 = on", ge=0.0, le=1.0)
-
-    @field_validator("level")
-    @classmethod
-    def validate_level(cls, v: str) -> str:
-        v = v.lower().strip()
-        if v not in ("macro", "meso", "micro"):
-            raise ValueError("level must be 'macro', 'meso', or 'micro'")
-        return v
-
-
-class CombInput(BaseModel):
+class CombInput(_LeveledInput):
     """Input for comb filter delay."""
-    model_config = ConfigDict(str_strip_whitespace=True)
-    level: str = Field(..., description="'macro' (10-3000), 'meso' (10-1000), or 'micro' (10-300)")
+    level: Level = Field(..., description="'macro' (10-3000), 'meso' (10-1000), or 'micro' (10-300)")
     value: float = Field(..., description="Comb delay amount")
 
-    @field_validator("level")
-    @classmethod
-    def validate_level(cls, v: str) -> str:
-        v = v.lower().strip()
-        if v not in ("macro", "meso", "micro"):
-            raise ValueError("level must be 'macro', 'meso', or 'micro'")
-        return v
-
-
-class CombMRInput(BaseModel):
-    """Input for comb filter modulation range."""
-    model_config = ConfigDict(str_strip_whitespace=True)
-    level: str = Field(..., description="'macro', 'meso', or 'micro'")
-    value: float = Field(..., description="Modulation range (0.0 to 0.75)", ge=0.0, le=0.75)
-
-    @field_validator("level")
-    @classmethod
-    def validate_level(cls, v: str) -> str:
-        v = v.lower().strip()
-        if v not in ("macro", "meso", "micro"):
-            raise ValueError("level must be 'macro', 'meso', or 'micro'")
-        return v
-
-
-class CombSwitchInput(BaseModel):
-    """Input for comb filter on/off per level."""
-    model_config = ConfigDict(str_strip_whitespace=True)
-    level: str = Field(..., description="'macro', 'meso', or 'micro'")
-    state: float = Field(..., description="0.0 = off, 1.0 = on", ge=0.0, le=1.0)
-
-    @field_validator("level")
-    @classmethod
-    def validate_level(cls, v: str) -> str:
-        v = v.lower().strip()
-        if v not in ("macro", "meso", "micro"):
-            raise ValueError("level must be 'macro', 'meso', or 'micro'")
-        return v
-
 
-class ForceInput(BaseModel):
+class ForceInput(_LeveledInput):
     """Input for DSP interactable force (BH / WH)."""
-    model_config = ConfigDict(str_strip_whitespace=True)
-    level: str = Field(..., description="'macro', 'meso', or 'micro'")
     value: float = Field(..., description="Force (0.0 to 1.0)", ge=0.0, le=1.0)
 
-    @field_validator("level")
-    @classmethod
-    def validate_level(cls, v: str) -> str:
-        v = v.lower().strip()
-        if v not in ("macro", "meso", "micro"):
-            raise ValueError("level must be 'macro', 'meso', or 'micro'")
-        return v
-
 
-class RingModInput(BaseModel):
+class RingModInput(_LeveledInput):
     """Input for ring modulator frequency."""
-    model_config = ConfigDict(str_strip_whitespace=True)
-    level: str = Field(..., description="'macro', 'meso', or 'micro'")
     value: float = Field(..., description="Mod frequency (1.0 to 3.0)", ge=1.0, le=3.0)
 
-    @field_validator("level")
-    @classmethod
-    def validate_level(cls, v: str) -> str:
-        v = v.lower().strip()
-        if v not in ("macro", "meso", "micro"):
-            raise ValueError("level must be 'macro', 'meso', or 'micro'")
-        return v
-
 
-class CubeReturnInput(BaseModel):
+class CubeReturnInput(_LeveledInput):
     """Input for cuboid FX return level."""
-    model_config = ConfigDict(str_strip_whitespace=True)
-    level: str = Field(..., description="'macro', 'meso', or 'micro'")
     value: float = Field(..., description="Return level (1.0 to 80.0)", ge=1.0, le=80.0)
 
-    @field_validator("level")
-    @classmethod
-    def validate_level(cls, v: str) -> str:
-        v = v.lower().strip()
-        if v not in ("macro", "meso", "micro"):
-            raise ValueError("level must be 'macro', 'meso', or 'micro'")
-        return v
-
 
-class GainSoloInput(BaseModel):
+class GainSoloInput(_LeveledInput):
     """Input for gain solo."""
-    model_config = ConfigDict(str_strip_whitespace=True)
-    level: str = Field(..., description="'macro', 'meso', or 'micro'")
     state: float = Field(..., description="0.0 = off, 1.0 = solo", ge=0.0, le=1.0)
 
-    @field_validator("level")
-    @classmethod
-    def validate_level(cls, v: str) -> str:
-        v = v.lower().strip()
-        if v not in ("macro", "meso", "micro"):
-            raise ValueError("level must be 'macro', 'meso', or 'micro'")
-        return v
-
 
 class CrushBitInput(BaseModel):
     """Input for bitcrusher bit level."""
-    model_config = ConfigDict(str_strip_whitespace=True)
     value: float = Field(..., description="Bit level (0.0 to 1.0)", ge=0.0, le=1.0)
 
 
 class CrushRangeInput(BaseModel):
     """Input for bitcrusher range."""
-    model_config = ConfigDict(str_strip_whitespace=True)
     value: float = Field(..., description="Range (0.0 to 5.0)", ge=0.0, le=5.0)
 
 
 class ResonatorFreqDistInput(BaseModel):
     """Input for resonator frequency distribution."""
-    model_config = ConfigDict(str_strip_whitespace=True)
     value: float = Field(..., description="Frequency distribution (1.0 to 3.0)", ge=1.0, le=3.0)
 
 
 class ResonatorBalanceInput(BaseModel):
     """Input for resonator balance."""
-    model_config = ConfigDict(str_strip_whitespace=True)
     value: float = Field(..., description="Balance (0.0 to 0.5)", ge=0.0, le=0.5)
 
 
 class IsomorphModInput(BaseModel):
     """Input for isomorphic modulation depth."""
-    model_config = ConfigDict(str_strip_whitespace=True)
-    param: str = Field(..., description="'freq', 'amp', or 'res'")
+    param: IsomorphParam = Field(..., description="'freq', 'amp', or 'res'")
     value: float = Field(..., description="Modulation depth (0.0 to 2.0)", ge=0.0, le=2.0)
 
-    @field_validator("param")
-    @classmethod
-    def validate_param(cls, v: str) -> str:
-        v = v.lower().strip()
-        if v not in ("freq", "amp", "res"):
-            raise ValueError("param must be 'freq', 'amp', or 'res'")
-        return v
-
 
 class IsomorphBPCenterInput(BaseModel):
     """Input for isomorphic bandpass center."""
-    model_config = ConfigDict(str_strip_whitespace=True)
     value: float = Field(..., description="Bandpass center (0.0 to 5000.0)", ge=0.0, le=5000.0)
 
 
 class CameraZoomInput(BaseModel):
     """Input for camera zoom."""
-    model_config = ConfigDict(str_strip_whitespace=True)
     value: float = Field(..., description="Zoom amount (positive = in, negative = out)")
 
 
 class CameraRotateInput(BaseModel):
     """Input for camera rotation."""
-    model_config = ConfigDict(str_strip_whitespace=True)
     value: float = Field(..., description="Rotation in radians")
 
 
 class BPMInput(BaseModel):
     """Input for BPM."""
-    model_config = ConfigDict(str_strip_whitespace=True)
     value: float = Field(..., description="BPM (10.0 to 300.0)", ge=10.0, le=300.0)
 
 
+class OscMessageInput(BaseModel):
+    """A single OSC address/value pair."""
+    model_config = ConfigDict(str_strip_whitespace=True)
+    address: str = Field(..., description="OSC address (e.g. '/polynodes/MacroGain')")
+    value: OscFloat = Field(..., description="Float value to send")
+
+
+class BatchInput(BaseModel):
+    """Input for sending several OSC messages at once."""
+    messages: list[OscMessageInput] = Field(..., description="Messages to send together", min_length=1)
+
+
 # ---------------------------------------------------------------------------
 # Tools - Transport / Playback
 # ---------------------------------------------------------------------------
 
-@mcp.tool(
-    name="polynodes_play_stop",
-    annotations={
-        "title": "Play/Stop PolyNodes",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
+@_setter_tool("polynodes_play_stop", "Play/Stop PolyNodes")
 def polynodes_play_stop(params: PlayStopInput) -> str:
     """Start or stop PolyNodes playback.
 
@@ -380,16 +857,7 @@ def polynodes_play_stop(params: PlayStopInput) -> str:
     return _send_osc("/polynodes/playstartstop", params.state)
 
 
-@mcp.tool(
-    name="polynodes_preset_slot",
-    annotations={
-        "title": "Select Preset Slot",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
+@_setter_tool("polynodes_preset_slot", "Select Preset Slot")
 def polynodes_preset_slot(params: PresetSlotInput) -> str:
     """Select a preset slot (1-10) on PolyNodes.
 
@@ -406,16 +874,7 @@ def polynodes_preset_slot(params: PresetSlotInput) -> str:
 # Tools - Gain
 # ---------------------------------------------------------------------------
 
-@mcp.tool(
-    name="polynodes_set_gain",
-    annotations={
-        "title": "Set Layer Gain",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
+@_setter_tool("polynodes_set_gain", "Set Layer Gain")
 def polynodes_set_gain(params: GainInput) -> str:
     """Set gain for a macro/meso/micro layer (-80 to 20 dB).
 
@@ -425,24 +884,10 @@ def polynodes_set_gain(params: GainInput) -> str:
     Returns:
         JSON confirmation.
     """
-    addr_map = {
-        "macro": "/polynodes/MacroGain",
-        "meso": "/polynodes/MesoGain",
-        "micro": "/polynodes/MicroGain",
-    }
-    return _send_osc(addr_map[params.level], params.value)
+    return _send_osc(_GAIN_ADDRS[params.level], params.value)
 
 
-@mcp.tool(
-    name="polynodes_set_dry_wet",
-    annotations={
-        "title": "Set Dry/Wet Balance",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
+@_setter_tool("polynodes_set_dry_wet", "Set Dry/Wet Balance")
 def polynodes_set_dry_wet(params: DryWetInput) -> str:
     """Set the dry/wet balance (0.0=dry original, 1.0=wet synthesis).
 
@@ -455,16 +900,7 @@ def polynodes_set_dry_wet(params: DryWetInput) -> str:
     return _send_osc("/polynodes/DryWet", params.value)
 
 
-@mcp.tool(
-    name="polynodes_gain_solo",
-    annotations={
-        "title": "Solo Layer Gain",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
+@_setter_tool("polynodes_gain_solo", "Solo Layer Gain")
 def polynodes_gain_solo(params: GainSoloInput) -> str:
     """Solo a specific layer (macro/meso/micro).
 
@@ -474,28 +910,14 @@ def polynodes_gain_solo(params: GainSoloInput) -> str:
     Returns:
         JSON confirmation.
     """
-    addr_map = {
-        "macro": "/polynodes/MacroGainsolo",
-        "meso": "/polynodes/MesoGainsolo",
-        "micro": "/polynodes/MicroGainsolo",
-    }
-    return _send_osc(addr_map[params.level], params.state)
+    return _send_osc(_GAIN_SOLO_ADDRS[params.level], params.state)
 
 
 # ---------------------------------------------------------------------------
 # Tools - Envelope
 # ---------------------------------------------------------------------------
 
-@mcp.tool(
-    name="polynodes_set_envelope_time",
-    annotations={
-        "title": "Set Envelope Time",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
+@_setter_tool("polynodes_set_envelope_time", "Set Envelope Time")
 def polynodes_set_envelope_time(params: EnvelopeTimeInput) -> str:
     """Set attack/decay envelope time for macro/meso/micro agents (0.01-0.5).
 
@@ -505,28 +927,14 @@ def polynodes_set_envelope_time(params: EnvelopeTimeInput) -> str:
     Returns:
         JSON confirmation.
     """
-    addr_map = {
-        "macro": "/polynodes/MacroEnvtime",
-        "meso": "/polynodes/MesoEnvtime",
-        "micro": "/polynodes/MicroEnvtime",
-    }
-    return _send_osc(addr_map[params.level], params.value)
+    return _send_osc(_ENVTIME_ADDRS[params.level], params.value)
 
 
 # ---------------------------------------------------------------------------
 # Tools - Playback Rate
 # ---------------------------------------------------------------------------
 
-@mcp.tool(
-    name="polynodes_set_playback_rate",
-    annotations={
-        "title": "Set Playback Rate",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
+@_setter_tool("polynodes_set_playback_rate", "Set Playback Rate")
 def polynodes_set_playback_rate(params: PlaybackRateInput) -> str:
     """Set playback rate for agents. Macro: 0.3-10, Meso: 0.3-20, Micro: 0.3-30.
 
@@ -536,25 +944,11 @@ def polynodes_set_playback_rate(params: PlaybackRateInput) -> str:
     Returns:
         JSON confirmation.
     """
-    addr_map = {
-        "macro": "/polynodes/pbrmacro",
-        "meso": "/polynodes/pbrmeso",
-        "micro": "/polynodes/pbrmicro",
-    }
-    return _send_osc(addr_map[params.level], params.value)
+    return _send_osc(_PBR_ADDRS[params.level], params.value)
 
 
-@mcp.tool(
-    name="polynodes_set_playback_rate_mod_range",
-    annotations={
-        "title": "Set PB Rate Modulation Range",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
-def polynodes_set_playback_rate_mod_range(params: PlaybackRateMRInput) -> str:
+@_setter_tool("polynodes_set_playback_rate_mod_range", "Set PB Rate Modulation Range")
+def polynodes_set_playback_rate_mod_range(params: LeveledModRangeInput) -> str:
     """Set the stochastic modulation range for playback rate (0.0-0.75).
 
     Args:
@@ -563,28 +957,14 @@ def polynodes_set_playback_rate_mod_range(params: PlaybackRateMRInput) -> str:
     Returns:
         JSON confirmation.
     """
-    addr_map = {
-        "macro": "/polynodes/pbrmacroMR",
-        "meso": "/polynodes/pbrmesoMR",
-        "micro": "/polynodes/pbrmicroMR",
-    }
-    return _send_osc(addr_map[params.level], params.value)
+    return _send_osc(_PBR_MR_ADDRS[params.level], params.value)
 
 
 # ---------------------------------------------------------------------------
 # Tools - Granulator
 # ---------------------------------------------------------------------------
 
-@mcp.tool(
-    name="polynodes_granular_switch",
-    annotations={
-        "title": "Granulator On/Off",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
+@_setter_tool("polynodes_granular_switch", "Granulator On/Off")
 def polynodes_granular_switch(params: SwitchInput) -> str:
     """Turn the granulator on or off.
 
@@ -597,16 +977,7 @@ def polynodes_granular_switch(params: SwitchInput) -> str:
     return _send_osc("/polynodes/granusw", params.state)
 
 
-@mcp.tool(
-    name="polynodes_granular_duration",
-    annotations={
-        "title": "Set Granular Duration",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
+@_setter_tool("polynodes_granular_duration", "Set Granular Duration")
 def polynodes_granular_duration(params: GranularDurationInput) -> str:
     """Set granular chunk duration (10-1000).
 
@@ -619,16 +990,7 @@ def polynodes_granular_duration(params: GranularDurationInput) -> str:
     return _send_osc("/polynodes/granuDur", params.value)
 
 
-@mcp.tool(
-    name="polynodes_granular_duration_mod_range",
-    annotations={
-        "title": "Set Granular Duration Mod Range",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
+@_setter_tool("polynodes_granular_duration_mod_range", "Set Granular Duration Mod Range")
 def polynodes_granular_duration_mod_range(params: GranularDurationMRInput) -> str:
     """Set granular duration modulation range (0.0-0.75).
 
@@ -645,17 +1007,8 @@ def polynodes_granular_duration_mod_range(params: GranularDurationMRInput) -> st
 # Tools - Bandpass Filter
 # ---------------------------------------------------------------------------
 
-@mcp.tool(
-    name="polynodes_filter_switch",
-    annotations={
-        "title": "Bandpass Filter On/Off",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
-def polynodes_filter_switch(params: FilterSwitchInput) -> str:
+@_setter_tool("polynodes_filter_switch", "Bandpass Filter On/Off")
+def polynodes_filter_switch(params: LeveledSwitchInput) -> str:
     """Turn bandpass filter on/off for a layer.
 
     Args:
@@ -664,24 +1017,10 @@ def polynodes_filter_switch(params: FilterSwitchInput) -> str:
     Returns:
         JSON confirmation.
     """
-    addr_map = {
-        "macro": "/polynodes/filtmacrosw",
-        "meso": "/polynodes/filtmesosw",
-        "micro": "/polynodes/filtmicrosw",
-    }
-    return _send_osc(addr_map[params.level], params.state)
+    return _send_osc(_FILTER_SW_ADDRS[params.level], params.state)
 
 
-@mcp.tool(
-    name="polynodes_set_filter_freq",
-    annotations={
-        "title": "Set Filter Frequency",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
+@_setter_tool("polynodes_set_filter_freq", "Set Filter Frequency")
 def polynodes_set_filter_freq(params: FilterInput) -> str:
     """Set bandpass filter center frequency (80-8000 Hz).
 
@@ -691,25 +1030,11 @@ def polynodes_set_filter_freq(params: FilterInput) -> str:
     Returns:
         JSON confirmation.
     """
-    addr_map = {
-        "macro": "/polynodes/filtmacro",
-        "meso": "/polynodes/filtmeso",
-        "micro": "/polynodes/filtmicro",
-    }
-    return _send_osc(addr_map[params.level], params.value)
+    return _send_osc(_FILTER_ADDRS[params.level], params.value)
 
 
-@mcp.tool(
-    name="polynodes_set_filter_mod_range",
-    annotations={
-        "title": "Set Filter Modulation Range",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
-def polynodes_set_filter_mod_range(params: FilterMRInput) -> str:
+@_setter_tool("polynodes_set_filter_mod_range", "Set Filter Modulation Range")
+def polynodes_set_filter_mod_range(params: LeveledModRangeInput) -> str:
     """Set bandpass filter modulation range (0.0-0.75).
 
     Args:
@@ -718,29 +1043,15 @@ def polynodes_set_filter_mod_range(params: FilterMRInput) -> str:
     Returns:
         JSON confirmation.
     """
-    addr_map = {
-        "macro": "/polynodes/filtmacroMR",
-        "meso": "/polynodes/filtmesoMR",
-        "micro": "/polynodes/filtmicroMR",
-    }
-    return _send_osc(addr_map[params.level], params.value)
+    return _send_osc(_FILTER_MR_ADDRS[params.level], params.value)
 
 
 # ---------------------------------------------------------------------------
 # Tools - Comb Filter
 # ---------------------------------------------------------------------------
 
-@mcp.tool(
-    name="polynodes_comb_switch",
-    annotations={
-        "title": "Comb Filter On/Off",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
-def polynodes_comb_switch(params: CombSwitchInput) -> str:
+@_setter_tool("polynodes_comb_switch", "Comb Filter On/Off")
+def polynodes_comb_switch(params: LeveledSwitchInput) -> str:
     """Turn comb filter on/off for a layer.
 
     Args:
@@ -749,24 +1060,10 @@ def polynodes_comb_switch(params: CombSwitchInput) -> str:
     Returns:
         JSON confirmation.
     """
-    addr_map = {
-        "macro": "/polynodes/combmacrosw",
-        "meso": "/polynodes/combmesosw",
-        "micro": "/polynodes/combmicrosw",
-    }
-    return _send_osc(addr_map[params.level], params.state)
+    return _send_osc(_COMB_SW_ADDRS[params.level], params.state)
 
 
-@mcp.tool(
-    name="polynodes_set_comb_delay",
-    annotations={
-        "title": "Set Comb Delay",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
+@_setter_tool("polynodes_set_comb_delay", "Set Comb Delay")
 def polynodes_set_comb_delay(params: CombInput) -> str:
     """Set comb filter delay. Macro: 10-3000, Meso: 10-1000, Micro: 10-300.
 
@@ -776,25 +1073,11 @@ def polynodes_set_comb_delay(params: CombInput) -> str:
     Returns:
         JSON confirmation.
     """
-    addr_map = {
-        "macro": "/polynodes/combmacro",
-        "meso": "/polynodes/combmeso",
-        "micro": "/polynodes/combmicro",
-    }
-    return _send_osc(addr_map[params.level], params.value)
+    return _send_osc(_COMB_ADDRS[params.level], params.value)
 
 
-@mcp.tool(
-    name="polynodes_set_comb_mod_range",
-    annotations={
-        "title": "Set Comb Modulation Range",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
-def polynodes_set_comb_mod_range(params: CombMRInput) -> str:
+@_setter_tool("polynodes_set_comb_mod_range", "Set Comb Modulation Range")
+def polynodes_set_comb_mod_range(params: LeveledModRangeInput) -> str:
     """Set comb filter modulation range (0.0-0.75).
 
     Args:
@@ -803,28 +1086,14 @@ def polynodes_set_comb_mod_range(params: CombMRInput) -> str:
     Returns:
         JSON confirmation.
     """
-    addr_map = {
-        "macro": "/polynodes/combmacroMR",
-        "meso": "/polynodes/combmesoMR",
-        "micro": "/polynodes/combmicroMR",
-    }
-    return _send_osc(addr_map[params.level], params.value)
+    return _send_osc(_COMB_MR_ADDRS[params.level], params.value)
 
 
 # ---------------------------------------------------------------------------
 # Tools - DSP Interactables (Black Hole, White Hole, Ring Mod, Crusher, Resonator)
 # ---------------------------------------------------------------------------
 
-@mcp.tool(
-    name="polynodes_blackhole_switch",
-    annotations={
-        "title": "Black Hole On/Off",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
+@_setter_tool("polynodes_blackhole_switch", "Black Hole On/Off")
 def polynodes_blackhole_switch(params: SwitchInput) -> str:
     """Turn the Black Hole DSP interactable on or off.
 
@@ -837,16 +1106,7 @@ def polynodes_blackhole_switch(params: SwitchInput) -> str:
     return _send_osc("/polynodes/BHsw", params.state)
 
 
-@mcp.tool(
-    name="polynodes_blackhole_force",
-    annotations={
-        "title": "Set Black Hole Force",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
+@_setter_tool("polynodes_blackhole_force", "Set Black Hole Force")
 def polynodes_blackhole_force(params: ForceInput) -> str:
     """Set Black Hole gravitational force per layer (0.0-1.0).
 
@@ -856,24 +1116,10 @@ def polynodes_blackhole_force(params: ForceInput) -> str:
     Returns:
         JSON confirmation.
     """
-    addr_map = {
-        "macro": "/polynodes/BHmacroforce",
-        "meso": "/polynodes/BHmesoforce",
-        "micro": "/polynodes/BHmicroforce",
-    }
-    return _send_osc(addr_map[params.level], params.value)
+    return _send_osc(_BH_FORCE_ADDRS[params.level], params.value)
 
 
-@mcp.tool(
-    name="polynodes_whitehole_switch",
-    annotations={
-        "title": "White Hole On/Off",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
+@_setter_tool("polynodes_whitehole_switch", "White Hole On/Off")
 def polynodes_whitehole_switch(params: SwitchInput) -> str:
     """Turn the White Hole DSP interactable on or off.
 
@@ -886,16 +1132,7 @@ def polynodes_whitehole_switch(params: SwitchInput) -> str:
     return _send_osc("/polynodes/WHsw", params.state)
 
 
-@mcp.tool(
-    name="polynodes_whitehole_force",
-    annotations={
-        "title": "Set White Hole Force",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
+@_setter_tool("polynodes_whitehole_force", "Set White Hole Force")
 def polynodes_whitehole_force(params: ForceInput) -> str:
     """Set White Hole reflection force per layer (0.0-1.0).
 
@@ -905,24 +1142,10 @@ def polynodes_whitehole_force(params: ForceInput) -> str:
     Returns:
         JSON confirmation.
     """
-    addr_map = {
-        "macro": "/polynodes/WHmacroforce",
-        "meso": "/polynodes/WHmesoforce",
-        "micro": "/polynodes/WHmicroforce",
-    }
-    return _send_osc(addr_map[params.level], params.value)
+    return _send_osc(_WH_FORCE_ADDRS[params.level], params.value)
 
 
-@mcp.tool(
-    name="polynodes_ringmod_switch",
-    annotations={
-        "title": "Ring Modulator On/Off",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
+@_setter_tool("polynodes_ringmod_switch", "Ring Modulator On/Off")
 def polynodes_ringmod_switch(params: SwitchInput) -> str:
     """Turn Ring Modulator on or off.
 
@@ -935,16 +1158,7 @@ def polynodes_ringmod_switch(params: SwitchInput) -> str:
     return _send_osc("/polynodes/RMsw", params.state)
 
 
-@mcp.tool(
-    name="polynodes_ringmod_freq",
-    annotations={
-        "title": "Set Ring Mod Frequency",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
+@_setter_tool("polynodes_ringmod_freq", "Set Ring Mod Frequency")
 def polynodes_ringmod_freq(params: RingModInput) -> str:
     """Set ring modulator center frequency per layer (1.0-3.0).
 
@@ -954,24 +1168,10 @@ def polynodes_ringmod_freq(params: RingModInput) -> str:
     Returns:
         JSON confirmation.
     """
-    addr_map = {
-        "macro": "/polynodes/RMmacro",
-        "meso": "/polynodes/RMmeso",
-        "micro": "/polynodes/RMmicro",
-    }
-    return _send_osc(addr_map[params.level], params.value)
+    return _send_osc(_RM_ADDRS[params.level], params.value)
 
 
-@mcp.tool(
-    name="polynodes_crush_switch",
-    annotations={
-        "title": "Bitcrusher On/Off",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
+@_setter_tool("polynodes_crush_switch", "Bitcrusher On/Off")
 def polynodes_crush_switch(params: SwitchInput) -> str:
     """Turn Bitcrusher/Decimater on or off.
 
@@ -984,16 +1184,7 @@ def polynodes_crush_switch(params: SwitchInput) -> str:
     return _send_osc("/polynodes/CRSsw", params.state)
 
 
-@mcp.tool(
-    name="polynodes_crush_bit_level",
-    annotations={
-        "title": "Set Crush Bit Level",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
+@_setter_tool("polynodes_crush_bit_level", "Set Crush Bit Level")
 def polynodes_crush_bit_level(params: CrushBitInput) -> str:
     """Set bitcrusher bit depth level (0.0-1.0).
 
@@ -1006,16 +1197,7 @@ def polynodes_crush_bit_level(params: CrushBitInput) -> str:
     return _send_osc("/polynodes/CRSbitLvl", params.value)
 
 
-@mcp.tool(
-    name="polynodes_crush_range",
-    annotations={
-        "title": "Set Crush Range",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
+@_setter_tool("polynodes_crush_range", "Set Crush Range")
 def polynodes_crush_range(params: CrushRangeInput) -> str:
     """Set bitcrusher sampling frequency range (0.0-5.0).
 
@@ -1028,16 +1210,7 @@ def polynodes_crush_range(params: CrushRangeInput) -> str:
     return _send_osc("/polynodes/CRSrange", params.value)
 
 
-@mcp.tool(
-    name="polynodes_resonator_switch",
-    annotations={
-        "title": "Resonator On/Off",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
+@_setter_tool("polynodes_resonator_switch", "Resonator On/Off")
 def polynodes_resonator_switch(params: SwitchInput) -> str:
     """Turn Resonator on or off.
 
@@ -1050,16 +1223,7 @@ def polynodes_resonator_switch(params: SwitchInput) -> str:
     return _send_osc("/polynodes/ResoSw", params.state)
 
 
-@mcp.tool(
-    name="polynodes_resonator_freq_dist",
-    annotations={
-        "title": "Set Resonator Freq Distribution",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
+@_setter_tool("polynodes_resonator_freq_dist", "Set Resonator Freq Distribution")
 def polynodes_resonator_freq_dist(params: ResonatorFreqDistInput) -> str:
     """Set resonator frequency distribution (1.0-3.0).
 
@@ -1072,16 +1236,7 @@ def polynodes_resonator_freq_dist(params: ResonatorFreqDistInput) -> str:
     return _send_osc("/polynodes/ResoFreqdist", params.value)
 
 
-@mcp.tool(
-    name="polynodes_resonator_balance",
-    annotations={
-        "title": "Set Resonator Balance",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
+@_setter_tool("polynodes_resonator_balance", "Set Resonator Balance")
 def polynodes_resonator_balance(params: ResonatorBalanceInput) -> str:
     """Set resonator wet/dry balance (0.0-0.5).
 
@@ -1098,16 +1253,7 @@ def polynodes_resonator_balance(params: ResonatorBalanceInput) -> str:
 # Tools - Cuboid FX
 # ---------------------------------------------------------------------------
 
-@mcp.tool(
-    name="polynodes_cuboid_switch",
-    annotations={
-        "title": "Cuboid Switch",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
+@_setter_tool("polynodes_cuboid_switch", "Cuboid Switch")
 def polynodes_cuboid_switch(cube: int = Field(..., description="Cuboid number: 1, 2, or 3", ge=1, le=3), state: float = Field(..., description="0.0=off, 1.0=on", ge=0.0, le=1.0)) -> str:
     """Turn a cuboid (C1/C2/C3) on or off.
 
@@ -1118,19 +1264,10 @@ def polynodes_cuboid_switch(cube: int = Field(..., description="Cuboid number: 1
     Returns:
         JSON confirmation.
     """
-    return _send_osc(f"/polynodes/C{cube}sw", state)
+    return _send_osc(_CUBOID_SW_ADDRS[cube - 1], state)
 
 
-@mcp.tool(
-    name="polynodes_cuboid_return_level",
-    annotations={
-        "title": "Set Cuboid Return Level",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
+@_setter_tool("polynodes_cuboid_return_level", "Set Cuboid Return Level")
 def polynodes_cuboid_return_level(params: CubeReturnInput) -> str:
     """Set cuboid FX return level per layer (1.0-80.0).
 
@@ -1140,28 +1277,14 @@ def polynodes_cuboid_return_level(params: CubeReturnInput) -> str:
     Returns:
         JSON confirmation.
     """
-    addr_map = {
-        "macro": "/polynodes/MacroreturnLvl",
-        "meso": "/polynodes/MesoreturnLvl",
-        "micro": "/polynodes/MicroreturnLvl",
-    }
-    return _send_osc(addr_map[params.level], params.value)
+    return _send_osc(_CUBE_RETURN_ADDRS[params.level], params.value)
 
 
 # ---------------------------------------------------------------------------
 # Tools - Isomorphic Modulation
 # ---------------------------------------------------------------------------
 
-@mcp.tool(
-    name="polynodes_isomorph_switch",
-    annotations={
-        "title": "IsoMorph On/Off",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
+@_setter_tool("polynodes_isomorph_switch", "IsoMorph On/Off")
 def polynodes_isomorph_switch(params: SwitchInput) -> str:
     """Turn IsoMorph modulation on or off.
 
@@ -1174,16 +1297,7 @@ def polynodes_isomorph_switch(params: SwitchInput) -> str:
     return _send_osc("/polynodes/isomorphsw", params.state)
 
 
-@mcp.tool(
-    name="polynodes_isomorph_mod_switch",
-    annotations={
-        "title": "IsoMorph Modulation Target Switch",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
+@_setter_tool("polynodes_isomorph_mod_switch", "IsoMorph Modulation Target Switch")
 def polynodes_isomorph_mod_switch(param: str = Field(..., description="'freq', 'amp', or 'res'"), state: float = Field(..., description="0.0=off, 1.0=on", ge=0.0, le=1.0)) -> str:
     """Turn on/off a specific isomorphic modulation target (freq/amp/res).
 
@@ -1194,27 +1308,13 @@ def polynodes_isomorph_mod_switch(param: str = Field(..., description="'freq', '
     Returns:
         JSON confirmation.
     """
-    addr_map = {
-        "freq": "/polynodes/isomfreqsw",
-        "amp": "/polynodes/isomampsw",
-        "res": "/polynodes/isomressw",
-    }
-    param = param.lower().strip()
-    if param not in addr_map:
-        return json.dumps({"error": "param must be 'freq', 'amp', or 'res'"})
-    return _send_osc(addr_map[param], state)
+    addr = _ISOMORPH_SW_ADDRS.get(_fold_isomorph_param(param))
+    if addr is None:
+        return _ERR_ISOMORPH_PARAM_JSON
+    return _send_osc(addr, state)
 
 
-@mcp.tool(
-    name="polynodes_isomorph_mod_depth",
-    annotations={
-        "title": "Set IsoMorph Mod Depth",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
+@_setter_tool("polynodes_isomorph_mod_depth", "Set IsoMorph Mod Depth")
 def polynodes_isomorph_mod_depth(params: IsomorphModInput) -> str:
     """Set isomorphic modulation depth for freq/amp/res (0.0-2.0).
 
@@ -1224,24 +1324,10 @@ def polynodes_isomorph_mod_depth(params: IsomorphModInput) -> str:
     Returns:
         JSON confirmation.
     """
-    addr_map = {
-        "freq": "/polynodes/isomfreqmodr",
-        "amp": "/polynodes/isomampmodr",
-        "res": "/polynodes/isomresmodr",
-    }
-    return _send_osc(addr_map[params.param], params.value)
+    return _send_osc(_ISOMORPH_DEPTH_ADDRS[params.param], params.value)
 
 
-@mcp.tool(
-    name="polynodes_isomorph_bp_center",
-    annotations={
-        "title": "Set IsoMorph BP Center",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
+@_setter_tool("polynodes_isomorph_bp_center", "Set IsoMorph BP Center")
 def polynodes_isomorph_bp_center(params: IsomorphBPCenterInput) -> str:
     """Set isomorphic bandpass center frequency (0-5000).
 
@@ -1258,16 +1344,7 @@ def polynodes_isomorph_bp_center(params: IsomorphBPCenterInput) -> str:
 # Tools - Navigation & Misc
 # ---------------------------------------------------------------------------
 
-@mcp.tool(
-    name="polynodes_navigation_random_trigger",
-    annotations={
-        "title": "Navigation Random Trigger",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
+@_setter_tool("polynodes_navigation_random_trigger", "Navigation Random Trigger")
 def polynodes_navigation_random_trigger(params: SwitchInput) -> str:
     """Trigger random navigation mode changes.
 
@@ -1280,16 +1357,7 @@ def polynodes_navigation_random_trigger(params: SwitchInput) -> str:
     return _send_osc("/polynodes/navigrndtrig", params.state)
 
 
-@mcp.tool(
-    name="polynodes_rearrange_trigger",
-    annotations={
-        "title": "Rearrange Trigger",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
+@_setter_tool("polynodes_rearrange_trigger", "Rearrange Trigger")
 def polynodes_rearrange_trigger(params: SwitchInput) -> str:
     """Trigger Re-Arr mode (rearranges input sample chunks).
 
@@ -1302,16 +1370,7 @@ def polynodes_rearrange_trigger(params: SwitchInput) -> str:
     return _send_osc("/polynodes/rearrtrig", params.state)
 
 
-@mcp.tool(
-    name="polynodes_poly_gates_switch",
-    annotations={
-        "title": "Poly Gates On/Off",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
+@_setter_tool("polynodes_poly_gates_switch", "Poly Gates On/Off")
 def polynodes_poly_gates_switch(params: SwitchInput) -> str:
     """Turn Poly Gates on or off (BPM-synced layer gating).
 
@@ -1324,16 +1383,7 @@ def polynodes_poly_gates_switch(params: SwitchInput) -> str:
     return _send_osc("/polynodes/polygatessw", params.state)
 
 
-@mcp.tool(
-    name="polynodes_tuning_pb_switch",
-    annotations={
-        "title": "Tuning PB Switch",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
+@_setter_tool("polynodes_tuning_pb_switch", "Tuning PB Switch")
 def polynodes_tuning_pb_switch(params: SwitchInput) -> str:
     """Turn tuning scale application on PB rate on or off.
 
@@ -1346,16 +1396,7 @@ def polynodes_tuning_pb_switch(params: SwitchInput) -> str:
     return _send_osc("/polynodes/tuningpbsw", params.state)
 
 
-@mcp.tool(
-    name="polynodes_tuning_res_switch",
-    annotations={
-        "title": "Tuning Res Switch",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
+@_setter_tool("polynodes_tuning_res_switch", "Tuning Res Switch")
 def polynodes_tuning_res_switch(params: SwitchInput) -> str:
     """Turn tuning scale application on resonator filter on or off.
 
@@ -1372,16 +1413,7 @@ def polynodes_tuning_res_switch(params: SwitchInput) -> str:
 # Tools - Camera
 # ---------------------------------------------------------------------------
 
-@mcp.tool(
-    name="polynodes_camera_zoom",
-    annotations={
-        "title": "Camera Zoom",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
+@_setter_tool("polynodes_camera_zoom", "Camera Zoom")
 def polynodes_camera_zoom(params: CameraZoomInput) -> str:
     """Zoom the 3D camera (positive=in, negative=out).
 
@@ -1394,16 +1426,7 @@ def polynodes_camera_zoom(params: CameraZoomInput) -> str:
     return _send_osc("/polynodes/camzoom", params.value)
 
 
-@mcp.tool(
-    name="polynodes_camera_rotate",
-    annotations={
-        "title": "Camera Rotate",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
+@_setter_tool("polynodes_camera_rotate", "Camera Rotate")
 def polynodes_camera_rotate(params: CameraRotateInput) -> str:
     """Rotate the 3D camera (value in radians).
 
@@ -1420,16 +1443,7 @@ def polynodes_camera_rotate(params: CameraRotateInput) -> str:
 # Tools - BPM
 # ---------------------------------------------------------------------------
 
-@mcp.tool(
-    name="polynodes_set_bpm",
-    annotations={
-        "title": "Set BPM",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
+@_setter_tool("polynodes_set_bpm", "Set BPM")
 def polynodes_set_bpm(params: BPMInput) -> str:
     """Set the sequencer BPM (10-300).
 
@@ -1462,134 +1476,10 @@ def polynodes_list_osc_addresses() -> str:
     Returns:
         JSON with all OSC addresses grouped by category.
     """
-    addresses = {
-        "transport": {
-            "/polynodes/playstartstop": "Play/Stop (0.0 or 1.0)",
-            "/polynodes/presetslot": "Preset Slot (1-10)",
-            "/polynodes/seqbpm": "BPM (10-300)",
-        },
-        "gain": {
-            "/polynodes/MacroGain": "Macro Gain dB (-80 to 20)",
-            "/polynodes/MesoGain": "Meso Gain dB (-80 to 20)",
-            "/polynodes/MicroGain": "Micro Gain dB (-80 to 20)",
-            "/polynodes/DryWet": "Dry/Wet (0.0-1.0)",
-            "/polynodes/MacroGainsolo": "Macro Solo (0/1)",
-            "/polynodes/MesoGainsolo": "Meso Solo (0/1)",
-            "/polynodes/MicroGainsolo": "Micro Solo (0/1)",
-        },
-        "envelope": {
-            "/polynodes/MacroEnvtime": "Macro Env Time (0.01-0.5)",
-            "/polynodes/MesoEnvtime": "Meso Env Time (0.01-0.5)",
-            "/polynodes/MicroEnvtime": "Micro Env Time (0.01-0.5)",
-        },
-        "playback_rate": {
-            "/polynodes/pbrmacro": "Macro PBR (0.3-10)",
-            "/polynodes/pbrmeso": "Meso PBR (0.3-20)",
-            "/polynodes/pbrmicro": "Micro PBR (0.3-30)",
-            "/polynodes/pbrmacroMR": "Macro PBR ModRange (0-0.75)",
-            "/polynodes/pbrmesoMR": "Meso PBR ModRange (0-0.75)",
-            "/polynodes/pbrmicroMR": "Micro PBR ModRange (0-0.75)",
-        },
-        "granulator": {
-            "/polynodes/granusw": "Granulator Switch (0/1)",
-            "/polynodes/granuDur": "Duration (10-1000)",
-            "/polynodes/granuDurMR": "Duration ModRange (0-0.75)",
-        },
-        "bandpass_filter": {
-            "/polynodes/filtmacrosw": "Macro Filter Switch (0/1)",
-            "/polynodes/filtmesosw": "Meso Filter Switch (0/1)",
-            "/polynodes/filtmicrosw": "Micro Filter Switch (0/1)",
-            "/polynodes/filtmacro": "Macro Freq (80-8000)",
-            "/polynodes/filtmeso": "Meso Freq (80-8000)",
-            "/polynodes/filtmicro": "Micro Freq (80-8000)",
-            "/polynodes/filtmacroMR": "Macro Filter ModRange (0-0.75)",
-            "/polynodes/filtmesoMR": "Meso Filter ModRange (0-0.75)",
-            "/polynodes/filtmicroMR": "Micro Filter ModRange (0-0.75)",
-        },
-        "comb_filter": {
-            "/polynodes/combmacrosw": "Macro Comb Switch (0/1)",
-            "/polynodes/combmesosw": "Meso Comb Switch (0/1)",
-            "/polynodes/combmicrosw": "Micro Comb Switch (0/1)",
-            "/polynodes/combmacro": "Macro Comb (10-3000)",
-            "/polynodes/combmeso": "Meso Comb (10-1000)",
-            "/polynodes/combmicro": "Micro Comb (10-300)",
-            "/polynodes/combmacroMR": "Macro Comb ModRange (0-0.75)",
-            "/polynodes/combmesoMR": "Meso Comb ModRange (0-0.75)",
-            "/polynodes/combmicroMR": "Micro Comb ModRange (0-0.75)",
-        },
-        "blackhole": {
-            "/polynodes/BHsw": "BH Switch (0/1)",
-            "/polynodes/BHmacroforce": "BH Macro Force (0-1)",
-            "/polynodes/BHmesoforce": "BH Meso Force (0-1)",
-            "/polynodes/BHmicroforce": "BH Micro Force (0-1)",
-        },
-        "whitehole": {
-            "/polynodes/WHsw": "WH Switch (0/1)",
-            "/polynodes/WHmacroforce": "WH Macro Force (0-1)",
-            "/polynodes/WHmesoforce": "WH Meso Force (0-1)",
-            "/polynodes/WHmicroforce": "WH Micro Force (0-1)",
-        },
-        "ring_modulator": {
-            "/polynodes/RMsw": "RM Switch (0/1)",
-            "/polynodes/RMmacro": "RM Macro (1-3)",
-            "/polynodes/RMmeso": "RM Meso (1-3)",
-            "/polynodes/RMmicro": "RM Micro (1-3)",
-        },
-        "bitcrusher": {
-            "/polynodes/CRSsw": "Crush Switch (0/1)",
-            "/polynodes/CRSbitLvl": "Bit Level (0-1)",
-            "/polynodes/CRSrange": "Range (0-5)",
-        },
-        "resonator": {
-            "/polynodes/ResoSw": "Resonator Switch (0/1)",
-            "/polynodes/ResoFreqdist": "Freq Distribution (1-3)",
-            "/polynodes/ResoBalance": "Balance (0-0.5)",
-        },
-        "cuboid_fx": {
-            "/polynodes/C1sw": "Cuboid 1 Switch (0/1)",
-            "/polynodes/C2sw": "Cuboid 2 Switch (0/1)",
-            "/polynodes/C3sw": "Cuboid 3 Switch (0/1)",
-            "/polynodes/MacroreturnLvl": "Macro Return (1-80)",
-            "/polynodes/MesoreturnLvl": "Meso Return (1-80)",
-            "/polynodes/MicroreturnLvl": "Micro Return (1-80)",
-        },
-        "isomorph": {
-            "/polynodes/isomorphsw": "IsoMorph Switch (0/1)",
-            "/polynodes/isomfreqsw": "Freq Mod Switch (0/1)",
-            "/polynodes/isomfreqmodr": "Freq Mod Depth (0-2)",
-            "/polynodes/isomampsw": "Amp Mod Switch (0/1)",
-            "/polynodes/isomampmodr": "Amp Mod Depth (0-2)",
-            "/polynodes/isomressw": "Res Mod Switch (0/1)",
-            "/polynodes/isomresmodr": "Res Mod Depth (0-2)",
-            "/polynodes/isombpcent": "BP Center (0-5000)",
-        },
-        "navigation": {
-            "/polynodes/navigrndtrig": "Nav Random Trigger (0/1)",
-            "/polynodes/rearrtrig": "Rearrange Trigger (0/1)",
-            "/polynodes/polygatessw": "Poly Gates Switch (0/1)",
-        },
-        "tuning": {
-            "/polynodes/tuningpbsw": "Tuning PB Switch (0/1)",
-            "/polynodes/tuningressw": "Tuning Res Switch (0/1)",
-        },
-        "camera": {
-            "/polynodes/camzoom": "Camera Zoom (+/- float)",
-            "/polynodes/camrotate": "Camera Rotate (radians)",
-        },
-    }
-    return json.dumps(addresses, indent=2)
+    return _ADDRESSES_JSON
 
 
-@mcp.tool(
-    name="polynodes_send_raw_osc",
-    annotations={
-        "title": "Send Raw OSC Message",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
-)
+@_setter_tool("polynodes_send_raw_osc", "Send Raw OSC Message")
 def polynodes_send_raw_osc(address: str = Field(..., description="OSC address (e.g. '/polynodes/DryWet')"), value: float = Field(..., description="Float value to send")) -> str:
     """Send a raw OSC message to PolyNodes. Use this for any OSC address.
 
@@ -1600,7 +1490,63 @@ def polynodes_send_raw_osc(address: str = Field(..., description="OSC address (e
     Returns:
         JSON confirmation.
     """
-    return _send_osc(address, value)
+    # Arbitrary addresses/values would only churn the confirmation cache.
+    status = _SEND_STATUS if _send_osc_raw(address, value) else "dropped"
+    _forget_sent((address,))
+    return _format_reply(status, address, repr(value))
+
+
+@_setter_tool("polynodes_batch", "Send Batched OSC Messages")
+def polynodes_batch(params: BatchInput) -> str:
+    """Send several OSC messages in one OSC bundle (e.g. set all three layer gains at once).
+
+    Batches longer than 64 messages go out as consecutive bundles of 64.
+
+    Args:
+        params: list of messages, each with an OSC address and a float value.
+
+    Returns:
+        JSON confirmation listing every sent message.
+    """
+    return _send_osc_bundle([(m.address, m.value) for m in params.messages])
+
+
+@_setter_tool("polynodes_flush", "Flush Queued OSC Messages")
+def polynodes_flush() -> str:
+    """Send any OSC messages still waiting in the coalescing queue right away.
+
+    Only has an effect when the server runs with POLYNODES_COALESCE_MS set;
+    otherwise every message is already sent immediately.
+
+    Returns:
+        JSON with the number of messages flushed.
+    """
+    flushed = _flush_osc_queue(_send_dgram) if COALESCE_MS > 0 else 0
+    return json.dumps({"status": "flushed", "count": flushed})
+
+
+@mcp.tool(
+    name="polynodes_send_stats",
+    annotations={
+        "title": "OSC Send Statistics",
+        "readOnlyHint": True,
+        "destructiveHint": False,
+        "idempotentHint": True,
+        "openWorldHint": False,
+    },
+)
+def polynodes_send_stats() -> str:
+    """Report how many OSC messages were dropped instead of reaching PolyNodes.
+
+    Messages are dropped instead of stalling the server when the socket's send
+    buffer stays full or the coalescing queue overflows, and counted when the
+    socket rejects a send (e.g. PolyNodes is not running). Tools also report such
+    a message with status "dropped".
+
+    Returns:
+        JSON with the dropped-message count since the server started.
+    """
+    return json.dumps({"dropped": _dropped})
 
 
 # ---------------------------------------------------------------------------
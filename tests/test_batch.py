@@ -0,0 +1,22 @@
+"""Regression tests for polynodes_batch."""
+
+import pydantic
+import pytest
+
+import server
+
+
+def test_value_outside_float32_is_a_validation_error():
+    messages = [{"address": "/polynodes/MacroGain", "value": 1.0}] * 70
+    messages.append({"address": "/polynodes/camzoom", "value": 1e39})
+    with pytest.raises(pydantic.ValidationError, match="32-bit OSC float"):
+        server.BatchInput(messages=messages)
+
+
+def test_nothing_is_sent_when_a_later_bundle_cannot_be_encoded(monkeypatch):
+    sent = []
+    monkeypatch.setattr(server, "_send_dgram", lambda data: sent.append(data) or True)
+    pairs = [("/polynodes/MacroGain", 1.0)] * 70 + [("/polynodes/camzoom", 1e39)]
+    with pytest.raises(OverflowError):
+        server._send_osc_bundle(pairs)
+    assert not sent
@@ -0,0 +1,40 @@
+"""Regression tests for the coalescing queue (POLYNODES_COALESCE_MS)."""
+
+import json
+
+import pytest
+
+import server
+
+
+@pytest.fixture
+def coalescing(monkeypatch):
+    """Queue messages without a worker thread and start from an empty queue and count."""
+    monkeypatch.setattr(server, "COALESCE_MS", 5)
+    monkeypatch.setattr(server, "_dropped", 0)
+    server._osc_queue.clear()
+    yield
+    server._osc_queue.clear()
+
+
+def test_value_outside_float32_is_rejected_before_queueing(coalescing):
+    with pytest.raises(OverflowError):
+        server._send_osc_raw("/polynodes/camzoom", 1e39)
+    assert not server._osc_queue
+
+
+def test_failed_chunk_is_counted_and_flush_continues(coalescing):
+    for _ in range(server._COALESCE_MAX_MESSAGES + 1):
+        server._send_osc_raw("/polynodes/camzoom", 1.0)
+    datagrams = []
+
+    def send(data):
+        if not datagrams:
+            datagrams.append(None)
+            raise OSError(90, "Message too long")
+        datagrams.append(data)
+        return True
+
+    assert server._flush_osc_queue(send) == 1
+    assert json.loads(server.polynodes_send_stats()) == {"dropped": server._COALESCE_MAX_MESSAGES}
+    assert not server._osc_queue
@@ -0,0 +1,54 @@
+"""Regression tests for POLYNODES_DEDUP_MS (skipping repeated values per address)."""
+
+import json
+
+import pytest
+
+import server
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    """Enable dedup and capture datagrams instead of sending them."""
+    datagrams = []
+
+    def send(data):
+        datagrams.append(bytes(data))
+        return True
+
+    monkeypatch.setattr(server, "DEDUP_MS", 10_000)
+    monkeypatch.setattr(server, "_send_dgram", send)
+    monkeypatch.setattr(server, "_last_sent", {})
+    return datagrams
+
+
+def set_macro_gain(value):
+    return json.loads(server.polynodes_set_gain(server.GainInput(level="macro", value=value)))
+
+
+def test_repeated_value_is_skipped(sent):
+    assert set_macro_gain(-10)["status"] == "sent"
+    assert set_macro_gain(-10)["status"] == "unchanged"
+    assert len(sent) == 1
+
+
+def test_batch_invalidates_last_value(sent):
+    set_macro_gain(-10)
+    server.polynodes_batch(server.BatchInput(messages=[{"address": "/polynodes/MacroGain", "value": 5}]))
+    assert set_macro_gain(-10)["status"] == "sent"
+    assert len(sent) == 3
+
+
+def test_raw_osc_invalidates_last_value(sent):
+    set_macro_gain(-10)
+    server.polynodes_send_raw_osc("/polynodes/MacroGain", 5.0)
+    assert set_macro_gain(-10)["status"] == "sent"
+    assert len(sent) == 3
+
+
+def test_dropped_send_is_not_recorded(sent, monkeypatch):
+    monkeypatch.setattr(server, "_send_dgram", lambda data: False)
+    assert set_macro_gain(-10)["status"] == "dropped"
+    monkeypatch.setattr(server, "_send_dgram", lambda data: sent.append(bytes(data)) or True)
+    assert set_macro_gain(-10)["status"] == "sent"
+    assert len(sent) == 1